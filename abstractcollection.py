@@ -3,6 +3,21 @@ File: abstractcollection.py
 Author: Ken Lambert
 """
 
+import sys
+
+
+def _isCached(key):
+    """Returns True if key is one of the objects CPython keeps a
+    single shared copy of, whoever creates it."""
+    if key is None or type(key) is bool:
+        return True
+    if type(key) is int:
+        return -5 <= key <= 256
+    if type(key) is str:
+        return len(key) == 0 or (len(key) == 1 and ord(key) < 256)
+    return False
+
+
 class AbstractCollection(object):
     """An abstract collection implementation."""
 
@@ -28,6 +43,52 @@ class AbstractCollection(object):
         """Returns the string representation of self."""
         return "[" + ", ".join(map(str, self)) + "]"
 
+    def memory_stats(self, keys=False):
+        """Returns a dict describing the memory held by self: the
+        number of nodes (array slots for an array-based collection)
+        and the bytes they take, in O(1). If keys is True, also walks
+        the keys once and splits their bytes, each key object counted
+        once, into shared keys and owned keys, plus the ratio of node
+        bytes to key bytes; otherwise those three entries are None.
+        A key is shared if more than one node or slot of self holds
+        that object, or if it is one of the objects the interpreter
+        caches (None, bools, ints from -5 to 256, strings of at most
+        one character); every other key is owned by its one node."""
+        nodes, nodeBytes = self._footprint()
+        ownedBytes = None
+        sharedBytes = None
+        ratio = None
+        if keys:
+            holders = dict()
+            for key in self._keys():
+                if id(key) in holders:
+                    holders[id(key)][1] += 1
+                else:
+                    holders[id(key)] = [key, 1]
+            ownedBytes = 0
+            sharedBytes = 0
+            for key, count in holders.values():
+                if count > 1 or _isCached(key):
+                    sharedBytes += sys.getsizeof(key)
+                else:
+                    ownedBytes += sys.getsizeof(key)
+            keyBytes = ownedBytes + sharedBytes
+            ratio = nodeBytes / keyBytes if keyBytes else 0.0
+        return {"nodes": nodes,
+                "node_bytes": nodeBytes,
+                "key_bytes_owned": ownedBytes,
+                "key_bytes_shared": sharedBytes,
+                "overhead_ratio": ratio}
+
+    def _footprint(self):
+        """Returns the number of nodes or array slots of self and
+        the bytes they take."""
+        return 0, 0
+
+    def _keys(self):
+        """Returns an iterator over the keys held by self."""
+        return iter(self)
+
     def __add__(self, other):
         """Returns a new bag containing the contents
         of self and other."""
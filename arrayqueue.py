@@ -0,0 +1,73 @@
+"""
+File: arrayqueue.py
+"""
+
+import sys
+from abstractcollection import AbstractCollection
+
+class ArrayQueue(AbstractCollection):
+    """A ring buffer based queue implementation."""
+
+    # Class variable
+    DEFAULT_CAPACITY = 16
+
+    # Constructor
+    def __init__(self, sourceCollection = None):
+        """Sets the initial state of self, which includes the
+        contents of sourceCollection, if it's present."""
+        self._items = [None] * ArrayQueue.DEFAULT_CAPACITY
+        self._front = 0
+        AbstractCollection.__init__(self, sourceCollection)
+
+    # Accessor methods
+    def __iter__(self):
+        """Supports iteration over a view of self, from front to rear."""
+        capacity = len(self._items)
+        for offset in range(self._size):
+            yield self._items[(self._front + offset) % capacity]
+
+    def peek(self):
+        """
+        Returns the item at the front of the queue.
+        Precondition: the queue is not empty.
+        Raises: KeyError if the queue is empty."""
+        if self.isEmpty():
+            raise KeyError("The queue is empty.")
+        return self._items[self._front]
+
+    def _footprint(self):
+        """Returns the number of slots in the backing list of self
+        and the bytes it takes."""
+        return len(self._items), sys.getsizeof(self._items)
+
+    # Mutator methods
+    def clear(self):
+        """Makes self become empty."""
+        self._size = 0
+        self._front = 0
+        self._items = [None] * ArrayQueue.DEFAULT_CAPACITY
+
+    def add(self, item):
+        """Adds item to the rear of the queue."""
+        capacity = len(self._items)
+        if self._size == capacity:
+            # Unroll the ring into a list twice as long
+            self._items = list(self) + [None] * capacity
+            self._front = 0
+            capacity *= 2
+        self._items[(self._front + self._size) % capacity] = item
+        self._size += 1
+
+    def pop(self):
+        """
+        Removes and returns the item at the front of the queue.
+        Precondition: the queue is not empty.
+        Raises: KeyError if the queue is empty.
+        Postcondition: the front item is removed from the queue."""
+        if self.isEmpty():
+            raise KeyError("The queue is empty.")
+        data = self._items[self._front]
+        self._items[self._front] = None
+        self._front = (self._front + 1) % len(self._items)
+        self._size -= 1
+        return data
@@ -0,0 +1,86 @@
+"""
+File: async_bench.py
+
+Measures lookup latency under concurrent load, calling LinkedBST
+directly from coroutines and through AsyncLinkedBST.
+"""
+
+from asyncbst import AsyncLinkedBST
+from linkedbst import LinkedBST
+import asyncio
+import random
+import time
+
+CLIENTS = 100
+LOOKUPS = 50
+INTERVAL = 0.01
+
+
+def percentile(latencies, share):
+    """Returns the latency below which share of the latencies fall."""
+    return latencies[min(len(latencies) - 1, int(len(latencies) * share))]
+
+
+async def client(lookup, words, latencies):
+    """Issues LOOKUPS lookups, one every INTERVAL seconds, and records
+    how long after its due time each one was answered."""
+    loop = asyncio.get_running_loop()
+    due = loop.time() + random.random() * INTERVAL
+    for _ in range(LOOKUPS):
+        await asyncio.sleep(max(0, due - loop.time()))
+        await lookup(random.choice(words))
+        latencies.append(loop.time() - due)
+        due += INTERVAL
+
+
+async def direct(tree, words):
+    """Lookups and heavy calls go straight to the tree."""
+
+    async def lookup(word):
+        return tree.find(word)
+
+    async def heavy():
+        await asyncio.sleep(INTERVAL * LOOKUPS / 4)
+        tree.range_find(words[0], words[-1])
+        tree.rebalance()
+
+    latencies = []
+    clients = [client(lookup, words, latencies) for _ in range(CLIENTS)]
+    await asyncio.gather(heavy(), *clients)
+    return latencies
+
+
+async def facade(tree, words):
+    """Lookups and heavy calls go through AsyncLinkedBST."""
+    service = AsyncLinkedBST(tree)
+
+    async def heavy():
+        await asyncio.sleep(INTERVAL * LOOKUPS / 4)
+        await service.range_find(words[0], words[-1])
+        await service.rebalance()
+
+    latencies = []
+    clients = [client(service.find, words, latencies)
+               for _ in range(CLIENTS)]
+    await asyncio.gather(heavy(), *clients)
+    return latencies
+
+
+def main():
+    tree = LinkedBST.from_file("words.txt")
+    words = list(tree.inorder())
+    print("{} words, {} clients x {} lookups every {} ms".format(
+        len(words), CLIENTS, LOOKUPS, INTERVAL * 1000))
+    for name, run in (("direct", direct), ("facade", facade)):
+        start = time.perf_counter()
+        latencies = sorted(asyncio.run(run(tree, words)))
+        elapsed = time.perf_counter() - start
+        print("{:>7}: p50 {:7.2f} ms  p99 {:7.2f} ms  max {:7.2f} ms"
+              "  ({:.2f} s)".format(name,
+                                   percentile(latencies, 0.5) * 1000,
+                                   percentile(latencies, 0.99) * 1000,
+                                   latencies[-1] * 1000, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+File: async_probe.py
+
+A tester program for serving binary search trees to coroutines.
+"""
+
+from asyncbst import AsyncLinkedBST
+from linkedbst import LinkedBST
+import asyncio
+
+LETTERS = "hdmbfjoacegiknp"
+
+
+async def coalescing():
+    """Lookups made in one turn of the loop share one batched descent."""
+    tree = LinkedBST(LETTERS)
+    batches = []
+    findMany = tree.find_many
+
+    def counted(items):
+        items = list(items)
+        batches.append(len(items))
+        return findMany(items)
+
+    tree.find_many = counted
+    service = AsyncLinkedBST(tree)
+    results = await asyncio.gather(*(service.find(item) for item in "aei"))
+    print("Expect ['a', 'e', 'i']: ", results)
+    print("Expect [3] for the batches: ", batches)
+
+
+async def errors():
+    """A lookup that cannot be compared fails only its own caller."""
+    service = AsyncLinkedBST(LinkedBST(LETTERS))
+    results = await asyncio.gather(service.find("a"), service.find(1),
+                                   service.find("c"), return_exceptions=True)
+    print("\nExpect 'a', a TypeError and 'c': ",
+          results[0], type(results[1]).__name__, results[2])
+
+
+async def writersWait():
+    """Mutators that change nodes in place wait for an open scan, so
+    the scan sees the tree as it was when it began."""
+    service = AsyncLinkedBST(LinkedBST(LETTERS), yieldEvery=1)
+
+    async def removals():
+        await service.remove("m")
+        await service.remove("h")
+
+    seen = []
+    writer = None
+    async for item in service.inorder():
+        seen.append(item)
+        if writer is None:
+            writer = asyncio.ensure_future(removals())
+    await writer
+    print("\nExpect all 15 letters once: ", "".join(seen))
+    print("Expect no h or m after: ", "".join(service.tree.inorder()))
+
+
+async def closedScan():
+    """Closing a scan part way releases the mutators waiting on it."""
+    service = AsyncLinkedBST(LinkedBST(LETTERS), yieldEvery=1)
+    scan = service.inorder()
+    print("\nFirst item of the scan: ", await scan.__anext__())
+    writer = asyncio.ensure_future(service.add("z"))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    print("Expect False for the writer done: ", writer.done())
+    await scan.aclose()
+    await asyncio.wait_for(writer, 1)
+    print("Expect True for 'z' in tree: ", "z" in service.tree)
+
+
+async def rebalanceDuringScan():
+    """A rebalance goes on while a scan reads the old nodes."""
+    service = AsyncLinkedBST(LinkedBST(range(1, 65)), yieldEvery=1)
+
+    async def scan():
+        return [item async for item in service.inorder()]
+
+    seen, _ = await asyncio.gather(scan(), service.rebalance())
+    print("\nExpect True for the scan in order: ",
+          seen == list(range(1, 65)))
+    print("Expect 6 for height: ", service.tree.height())
+    print("Expect True for is_balanced: ", service.tree.is_balanced())
+
+
+def main():
+    for probe in (coalescing, errors, writersWait, closedScan,
+                  rebalanceDuringScan):
+        asyncio.run(probe())
+
+
+if __name__ == "__main__":
+    main()
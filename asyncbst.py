@@ -0,0 +1,197 @@
+"""
+File: asyncbst.py
+
+An asyncio facade for LinkedBST.
+"""
+
+from linkedbst import LinkedBST
+import asyncio
+import contextlib
+
+
+class AsyncLinkedBST(object):
+    """
+    Serves a LinkedBST to coroutines without blocking the event loop.
+
+    Lookups that arrive in the same turn of the loop are coalesced into
+    a single batched descent. Scans are async generators that give the
+    loop a turn every yieldEvery nodes. Mutators are serialized by a
+    lock, and those that change nodes in place also wait until no scan
+    is in progress, while new scans wait for a pending one of them, so
+    every scan sees one consistent tree. A rebalance instead copies the
+    tree in steps and swaps the copy in, so lookups and scans go on
+    reading the old nodes meanwhile.
+
+    A scan left suspended holds off those mutators until it finishes
+    or is closed, so break out of one with aclose() and do not await a
+    mutator from inside a scan.
+    """
+
+    def __init__(self, tree=None, yieldEvery=256):
+        """Wraps tree, or a new empty LinkedBST if tree is None."""
+        self._tree = LinkedBST() if tree is None else tree
+        self._yieldEvery = yieldEvery
+        self._pending = []
+        self._flushScheduled = False
+        self._writeLock = asyncio.Lock()
+        self._scans = 0
+        self._noScans = asyncio.Event()
+        self._noScans.set()
+        self._noWriter = asyncio.Event()
+        self._noWriter.set()
+
+    @property
+    def tree(self):
+        """The wrapped LinkedBST."""
+        return self._tree
+
+    def __len__(self):
+        """Returns the number of items in the tree."""
+        return len(self._tree)
+
+    # Accessor methods
+    async def find(self, item):
+        """If item matches an item in the tree, returns the
+        matched item, or None otherwise."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if not self._flushScheduled:
+            self._flushScheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    async def contains(self, item):
+        """Returns True if item is in the tree or False otherwise."""
+        return await self.find(item) is not None
+
+    async def range_scan(self, low, high):
+        """Supports async iteration over the items of the tree where
+        low <= item <= high, in order."""
+        await self._beginScan()
+        try:
+            visited = 0
+            for node in self._tree._rangeNodes(low, high):
+                for _ in range(node.count):
+                    yield node.data
+                visited += 1
+                if visited % self._yieldEvery == 0:
+                    await asyncio.sleep(0)
+        finally:
+            self._endScan()
+
+    async def inorder(self):
+        """Supports async iteration over the items of the tree in order."""
+        await self._beginScan()
+        try:
+            visited = 0
+            for node in self._tree._inorderNodes():
+                for _ in range(node.count):
+                    yield node.data
+                visited += 1
+                if visited % self._yieldEvery == 0:
+                    await asyncio.sleep(0)
+        finally:
+            self._endScan()
+
+    async def range_find(self, low, high):
+        """Returns a list of the items in the tree, where low <= item <= high."""
+        return [item async for item in self.range_scan(low, high)]
+
+    # Mutator methods
+    async def add(self, item):
+        """Adds item to the tree."""
+        async with self._exclusive():
+            self._tree.add(item)
+
+    async def remove(self, item):
+        """Removes item from the tree and returns it.
+        Raises: KeyError if item is not in the tree."""
+        async with self._exclusive():
+            return self._tree.remove(item)
+
+    async def remove_many(self, items, rebalance=False):
+        """Removes one occurrence of every item in items and returns
+        the number of items removed."""
+        async with self._exclusive():
+            removed = self._tree.remove_many(items)
+        if rebalance:
+            await self.rebalance()
+        return removed
+
+    async def remove_range(self, low, high, rebalance=False):
+        """Removes every item where low <= item <= high and returns
+        the number of items removed."""
+        async with self._exclusive():
+            removed = self._tree.remove_range(low, high)
+        if rebalance:
+            await self.rebalance()
+        return removed
+
+    async def rebalance(self):
+        """
+        Rebalances the tree. The items are collected in steps, then a
+        balanced copy is linked in a worker thread and swapped in, so
+        lookups and scans keep running on the old nodes meanwhile.
+        """
+        async with self._writeLock:
+            groups = []
+            for visited, node in enumerate(self._tree._inorderNodes(), 1):
+                groups.append((node.data, node.count))
+                if visited % self._yieldEvery == 0:
+                    await asyncio.sleep(0)
+            loop = asyncio.get_running_loop()
+            balanced = await loop.run_in_executor(
+                None, LinkedBST._fromGroups, groups, False,
+                self._tree._multiset)
+            self._tree._root = balanced._root
+
+    async def _beginScan(self):
+        """Waits out a mutator that is pending, then registers a scan."""
+        while not self._noWriter.is_set():
+            await self._noWriter.wait()
+        self._scans += 1
+        self._noScans.clear()
+
+    def _endScan(self):
+        """Unregisters a scan. Does not await, so it is safe in the
+        finally clause of an async generator being closed."""
+        self._scans -= 1
+        if self._scans == 0:
+            self._noScans.set()
+
+    @contextlib.asynccontextmanager
+    async def _exclusive(self):
+        """Holds the write lock and keeps scans out while a mutator
+        changes nodes in place. The body must not await."""
+        async with self._writeLock:
+            self._noWriter.clear()
+            try:
+                while self._scans:
+                    await self._noScans.wait()
+                yield
+            finally:
+                self._noWriter.set()
+
+    def _flush(self):
+        """Answers every lookup queued in this turn of the loop
+        with one batched descent. If the batch cannot be sorted, each
+        lookup is answered on its own, so every caller gets exactly
+        what a plain find would give it."""
+        pending = self._pending
+        self._pending = []
+        self._flushScheduled = False
+        try:
+            results = self._tree.find_many([item for item, _ in pending])
+        except Exception:
+            for item, future in pending:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(self._tree.find(item))
+                except Exception as error:
+                    future.set_exception(error)
+            return
+        for (item, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
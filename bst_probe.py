@@ -5,7 +5,9 @@ A tester program for binary search trees.
 """
 
 from linkedbst import LinkedBST
+import os
 import random
+import tempfile
 
 def main():
 
@@ -35,14 +37,14 @@ def main():
     print("\n\ninorder traversal: ", end="")
     for item in tree.inorder(): print(item, end = " ")
     
-    #print("\n\npreorder traversal: ", end="")
-    #for item in tree.preorder(): print(item, end = " ")
+    print("\n\npreorder traversal: ", end="")
+    for item in tree.preorder(): print(item, end = " ")
     
-    #print("\n\npostorder traversal: ", end="")
-    #for item in tree.postorder(): print(item, end = " ")
+    print("\n\npostorder traversal: ", end="")
+    for item in tree.postorder(): print(item, end = " ")
     
-    #print("\n\nlevelorder traversal: ", end="")
-    #for item in tree.levelorder(): print(item, end = " ")
+    print("\n\nlevelorder traversal: ", end="")
+    for item in tree.levelorder(): print(item, end = " ")
 
     print("\n\nRemoving all items:", end = " ")
     for item in "ABCDEFG":
@@ -70,6 +72,74 @@ def main():
     print(tree.predecessor(50))
     tree.rebalance()
     print(tree)
+
+    words = "the cat and the dog and the end".split()
+    tree = LinkedBST(words, multiset=True)
+    print("\nMultiset of", words, "\n" + str(tree))
+    print("Expect 3 for count('the'): ", tree.count("the"))
+    print("Expect [('the', 3), ('and', 2)]: ", tree.most_common(2))
+
+    tree = LinkedBST.from_file("some_text.txt")
+    print("\nFrom some_text.txt:\n" + str(tree))
+    print("Expect 4 for height: ", tree.height())
+    print("Expect True for is_balanced: ", tree.is_balanced())
+    print("Expect [] for balance_report: ", tree.balance_report())
+
+    # Unsorted input larger than the budget goes through spilled runs
+    numbers = [random.randint(0, 40) for _ in range(200)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "numbers.txt")
+        with open(path, "w") as file:
+            file.write("\n".join(map(str, numbers)))
+        tree = LinkedBST.from_file(path, normalize=int, memory_budget=16)
+        counted = LinkedBST.from_file(path, normalize=int, memory_budget=16,
+                                      multiset=True)
+    print("\nExpect True for spilled ints in order: ",
+          list(tree.inorder()) == sorted(set(numbers)))
+    print("Expect True for spilled counts: ",
+          list(counted.inorder()) == sorted(numbers))
+    print("Expect True for is_balanced: ", tree.is_balanced())
+
+    # Equal items sit on both sides of the root after a rebalance
+    tree = LinkedBST([2, 2, 2, 1, 3, 2, 2])
+    tree.rebalance()
+    print("\nDuplicates after rebalance:\n" + str(tree))
+    print("Expect 3 for remove_many of 2, 2, 2, 9, 0: ",
+          tree.remove_many([2, 2, 2, 9, 0]))
+    print("Expect [1, 2, 2, 3]: ", list(tree.inorder()))
+    print("Expect 4 for len: ", len(tree))
+    print("Expect 0 for remove_many of absent items: ",
+          tree.remove_many([0, 4, 2.5]))
+    print("Expect 2 for remove_many with rebalance: ",
+          tree.remove_many([2, 2, 2], rebalance=True))
+    print("Expect [1, 3] and height 1: ", list(tree.inorder()),
+          tree.height())
+
+    tree = LinkedBST("aaabbbbcc", multiset=True)
+    print("\nExpect 5 for partial counts: ",
+          tree.remove_many("abbcccc"))
+    print("Expect a a b b: ", " ".join(tree.inorder()))
+    print("Expect 2 for nodes: ", tree.memory_stats()["nodes"])
+
+    tree = LinkedBST([4, 2, 6, 1, 3, 5, 7, 4, 4])
+    tree.rebalance()
+    print("\nExpect 0 for remove_range(5, 3): ", tree.remove_range(5, 3))
+    print("Expect 9 for len: ", len(tree))
+    print("Expect 5 for remove_range(3, 5): ", tree.remove_range(3, 5))
+    print("Expect [1, 2, 6, 7]: ", list(tree.inorder()))
+    print("Expect 4 for len: ", len(tree))
+    tree = LinkedBST(range(1, 33))
+    print("Expect 16 for remove_range with rebalance: ",
+          tree.remove_range(9, 24, rebalance=True))
+    print("Expect 16 for len and 4 for height: ", len(tree), tree.height())
+    print("Expect True for is_balanced: ", tree.is_balanced())
+
+    for n in (3, 5):
+        tree = LinkedBST(range(1, n + 1))
+        print("\nChain of", n, "\n" + str(tree))
+        print("Expect False for is_balanced: ", tree.is_balanced())
+        tree.rebalance()
+        print("Expect True after rebalance: ", tree.is_balanced())
    #print("\nAdded ", lyst, "\n" + str(tree))
    # tree.remove(10)
     #print("\nAdded ", lyst, "\n" + str(tree))
@@ -0,0 +1,210 @@
+"""
+File: bstjournal.py
+
+A mutation journal that lets a LinkedBST survive a crash.
+"""
+
+from linkedbst import LinkedBST
+import json
+import os
+
+SNAPSHOT = "snapshot"
+JOURNAL = "journal.{}"
+
+# Mutations that may be replayed from a journal
+OPERATIONS = ("add", "remove", "replace", "clear",
+              "remove_many", "remove_range")
+
+
+class BSTJournal(object):
+    """
+    An append-only journal of the mutations of a LinkedBST.
+
+    The directory holds a sorted snapshot of the tree and the journal
+    of the mutations made since that snapshot was taken. Each mutation
+    is encoded before it runs and written once it has succeeded, so a
+    call that raises leaves no record to trip up a later replay. Every
+    record is flushed to the operating system at once, so a crash of
+    the process loses nothing; the journal is fsynced every syncEvery
+    records, so only an OS or power failure can lose the records since
+    the last sync. After compactEvery records the tree is compacted
+    into a new snapshot and a new journal is started, so a recovery
+    only replays the recent tail.
+
+    Items must survive a round trip through JSON unchanged, as strings
+    and numbers do; a mutation with any other item raises before it
+    changes the tree. The snapshot also stores whether the tree is a
+    multiset, and the directory must always be opened in that mode.
+    """
+
+    def __init__(self, directory, syncEvery=64, compactEvery=10000,
+                 multiset=False):
+        """Sets the initial state of self. Nothing is read or written
+        until recover is called."""
+        self._directory = directory
+        self._syncEvery = syncEvery
+        self._compactEvery = compactEvery
+        self._multiset = multiset
+        self._generation = 0
+        self._tree = None
+        self._file = None
+        self._records = 0
+        self._unsynced = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def recover(self):
+        """
+        Returns the tree stored in the directory, with self attached to
+        it. Loads the snapshot with a linear balanced build, then
+        replays the journal written since. A record torn by a crash at
+        the end of the journal is dropped.
+        Raises: ValueError if the directory holds a tree of the other
+        mode than self.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        tree = self._loadSnapshot()
+
+        journalPath = self._path(JOURNAL.format(self._generation))
+        if os.path.exists(journalPath):
+            with open(journalPath, 'r+b') as file:
+                end = 0
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        operation, args = json.loads(line)
+                    except ValueError:
+                        break
+                    self._replay(tree, operation, args)
+                    self._records += 1
+                    end += len(line)
+                # Cut off a torn record so new ones follow the last good one
+                file.truncate(end)
+        self._removeStaleJournals()
+
+        self._file = open(journalPath, 'a', encoding='utf-8')
+        self._tree = tree
+        tree._journal = self
+        return tree
+
+    def encode(self, operation, *args):
+        """Returns the journal record of a mutation. Called by the
+        tree before the mutation runs.
+        Raises: TypeError or ValueError if the arguments do not survive
+        a round trip through JSON unchanged."""
+        record = [operation, list(args)]
+        line = json.dumps(record)
+        if json.loads(line) != record:
+            raise ValueError("Cannot journal " + repr(args) +
+                             ", which change in a round trip through JSON")
+        return line + "\n"
+
+    def record(self, line):
+        """Appends a record made by encode to the journal. Called by
+        the tree once the mutation has been applied."""
+        self._file.write(line)
+        self._file.flush()
+        self._records += 1
+        self._unsynced += 1
+        if self._unsynced >= self._syncEvery:
+            self.sync()
+        if self._compactEvery and self._records >= self._compactEvery:
+            # The snapshot already holds this mutation
+            self.compact()
+
+    def sync(self):
+        """Forces the records written so far onto the disk, so they
+        survive an OS or power failure."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def compact(self):
+        """
+        Writes the attached tree to a new sorted snapshot and starts
+        an empty journal for it. The old journal is removed only once
+        the snapshot is safely in place.
+        """
+        generation = self._generation + 1
+        self._writeSnapshot(generation, self._tree._inorderNodes())
+
+        self._file.close()
+        self._generation = generation
+        self._file = open(self._path(JOURNAL.format(generation)), 'a',
+                          encoding='utf-8')
+        self._records = 0
+        self._unsynced = 0
+        self._removeStaleJournals()
+
+    def close(self):
+        """Syncs the journal and detaches it from its tree."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+        if self._tree is not None:
+            self._tree._journal = None
+            self._tree = None
+
+    def _loadSnapshot(self):
+        """Returns the tree in the snapshot. A directory used for the
+        first time gets an empty snapshot, which stores the mode."""
+        snapshotPath = self._path(SNAPSHOT)
+        if not os.path.exists(snapshotPath):
+            self._writeSnapshot(self._generation, ())
+        with open(snapshotPath, 'r', encoding='utf-8') as file:
+            header = json.loads(file.readline())
+            if header["multiset"] != self._multiset:
+                raise ValueError("The tree in " + self._directory +
+                                 " has multiset=" + str(header["multiset"]))
+            self._generation = header["generation"]
+            groups = (json.loads(line) for line in file)
+            return LinkedBST._fromGroups(groups, False, self._multiset)
+
+    def _writeSnapshot(self, generation, nodes):
+        """Replaces the snapshot with one of nodes, which are in order.
+        The new snapshot is complete on disk before it is renamed."""
+        snapshotPath = self._path(SNAPSHOT)
+        with open(snapshotPath + ".tmp", 'w', encoding='utf-8') as file:
+            header = {"generation": generation, "multiset": self._multiset}
+            file.write(json.dumps(header) + "\n")
+            for node in nodes:
+                file.write(json.dumps([node.data, node.count]) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(snapshotPath + ".tmp", snapshotPath)
+        self._syncDirectory()
+
+    def _replay(self, tree, operation, args):
+        """Applies one journal record to tree. Only calls that
+        succeeded were recorded, so the replay succeeds too."""
+        if operation not in OPERATIONS:
+            raise ValueError("Unknown journal operation: " + str(operation))
+        getattr(tree, operation)(*args)
+
+    def _removeStaleJournals(self):
+        """Removes the journals older than the snapshot."""
+        current = JOURNAL.format(self._generation)
+        prefix = JOURNAL.format("")
+        for name in os.listdir(self._directory):
+            if name.startswith(prefix) and name != current:
+                os.remove(self._path(name))
+
+    def _syncDirectory(self):
+        """Makes a rename in the directory durable, where supported."""
+        if hasattr(os, "O_DIRECTORY"):
+            handle = os.open(self._directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(handle)
+            finally:
+                os.close(handle)
+
+    def _path(self, name):
+        """Returns the path of the file name in the directory."""
+        return os.path.join(self._directory, name)
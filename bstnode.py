@@ -6,7 +6,25 @@ Author: Ken Lambert
 class BSTNode(object):
     """Represents a node for a linked binary search tree."""
 
+    __slots__ = ('data', 'left', 'right', 'height')
+
+    # Every plain node holds a single occurrence of its datum
+    count = 1
+
     def __init__(self, data, left = None, right = None):
         self.data = data
         self.left = left
         self.right = right
+        # Height of the subtree rooted here, kept up to date by the tree
+        self.height = 0
+
+
+class BSTCountNode(BSTNode):
+    """Represents a node for a linked binary search tree that
+    stores a datum together with its number of occurrences."""
+
+    __slots__ = ('count',)
+
+    def __init__(self, data, left = None, right = None, count = 1):
+        BSTNode.__init__(self, data, left, right)
+        self.count = count
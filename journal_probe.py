@@ -0,0 +1,97 @@
+"""
+File: journal_probe.py
+
+A tester program for recovering binary search trees from a journal.
+"""
+
+from bstjournal import BSTJournal
+import datetime
+import subprocess
+import sys
+import tempfile
+
+CRASH = """
+import os
+from bstjournal import BSTJournal
+tree = BSTJournal({!r}, syncEvery=64).recover()
+for item in range(10):
+    tree.add(item)
+os._exit(0)
+"""
+
+
+def failed_mutation(directory):
+    """A mutation that raises must not stop a later recovery."""
+    journal = BSTJournal(directory)
+    tree = journal.recover()
+    tree.add("b")
+    try:
+        tree.add(None)
+    except TypeError as error:
+        print("add(None) raised:", error)
+    try:
+        tree.remove("z")
+    except KeyError as error:
+        print("remove('z') raised:", error)
+    journal.close()
+
+    tree = BSTJournal(directory).recover()
+    print("Expect ['b'] after recovery: ", list(tree.inorder()))
+
+
+def process_crash(directory):
+    """Records written before the process dies without closing the
+    journal, and before any fsync, must survive."""
+    subprocess.run([sys.executable, "-c", CRASH.format(directory)],
+                   check=True)
+    tree = BSTJournal(directory).recover()
+    print("Expect 0..9 after a crash: ", list(tree.inorder()))
+
+
+def unjournaled_items(directory):
+    """An item JSON cannot carry unchanged must be refused before it
+    gets into the tree."""
+    journal = BSTJournal(directory)
+    tree = journal.recover()
+    tree.add("b")
+    for item in (datetime.date(2024, 1, 1), ("a", 1)):
+        try:
+            tree.add(item)
+        except (TypeError, ValueError) as error:
+            print("add(" + repr(item) + ") raised:", error)
+    print("Expect ['b'] before recovery: ", list(tree.inorder()))
+    journal.close()
+
+    tree = BSTJournal(directory).recover()
+    print("Expect ['b'] after recovery: ", list(tree.inorder()))
+
+
+def stored_mode(directory):
+    """The mode is stored when the directory is first used, so
+    reopening it in the other mode raises even before a compaction."""
+    journal = BSTJournal(directory, multiset=True)
+    tree = journal.recover()
+    tree.add("a")
+    tree.add("a")
+    journal.close()
+    try:
+        BSTJournal(directory).recover()
+    except ValueError as error:
+        print("Reopening as a set raised:", error)
+    tree = BSTJournal(directory, multiset=True).recover()
+    print("Expect 2 for count('a'): ", tree.count("a"))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        failed_mutation(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        process_crash(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        unjournaled_items(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        stored_mode(directory)
+
+
+if __name__ == "__main__":
+    main()
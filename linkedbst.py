@@ -4,23 +4,210 @@ Author: Ken Lambert
 """
 
 from abstractcollection import AbstractCollection
-from bstnode import BSTNode
-from linkedstack import LinkedStack
-from linkedqueue import LinkedQueue
-from math import log, log2
+from bstnode import BSTNode, BSTCountNode
+from arraystack import ArrayStack
+from arrayqueue import ArrayQueue
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from itertools import groupby
+import heapq
+import os
+import pickle
 import random
+import sys
+import tempfile
+
+
+def _height(node):
+    """Returns the stored height of the subtree at node, -1 if empty."""
+    return -1 if node is None else node.height
+
+
+def _updateHeight(node):
+    """Recomputes the height of node from the heights of its children."""
+    node.height = max(_height(node.left), _height(node.right)) + 1
+
+
+def _detachMax(node):
+    """Unlinks the node with the maximum item from the subtree at node.
+    Returns the new root of the subtree and the unlinked node."""
+    if node.right is None:
+        return node.left, node
+    node.right, maximum = _detachMax(node.right)
+    _updateHeight(node)
+    return node, maximum
+
+
+def _join(left, right):
+    """Returns the root of a tree made of the subtrees left and right,
+    where no item in left is greater than an item in right."""
+    if left is None:
+        return right
+    left, top = _detachMax(left)
+    top.left = left
+    top.right = right
+    _updateHeight(top)
+    return top
+
+
+def _readLines(path, encoding, chunkSize=1 << 20):
+    """Yields the lines of the file at path, reading it in chunks
+    of chunkSize characters so that only one chunk is in memory."""
+    with open(path, 'r', encoding=encoding) as file:
+        tail = ''
+        while True:
+            chunk = file.read(chunkSize)
+            if not chunk:
+                break
+            lines = (tail + chunk).split('\n')
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+
+
+def _groupSorted(items):
+    """Yields (item, count) pairs for runs of equal items in a
+    sorted iterable."""
+    for item, group in groupby(items):
+        yield item, sum(1 for _ in group)
+
+
+def _mergeGroups(pairs):
+    """Yields (item, count) pairs from sorted pairs, adding up the
+    counts of neighbouring pairs with equal items."""
+    for item, group in groupby(pairs, key=lambda pair: pair[0]):
+        yield item, sum(pair[1] for pair in group)
+
+
+def _spillRun(pairs, directory):
+    """Writes sorted (item, count) pairs to a new file in directory
+    and returns its path. The pairs are pickled one by one, so items
+    of any picklable type come back unchanged."""
+    handle, path = tempfile.mkstemp(dir=directory, suffix='.run')
+    with os.fdopen(handle, 'wb') as file:
+        for pair in pairs:
+            pickle.dump(pair, file, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _loadRun(path):
+    """Yields the (item, count) pairs written by _spillRun."""
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def _sortedGroups(items, memoryBudget, directory):
+    """
+    Returns a sorted list of (item, count) pairs for items.
+    Input that arrives in order is grouped on the fly. Otherwise at
+    most memoryBudget raw items are buffered: each full buffer is
+    sorted and spilled to directory, and the runs are merged.
+    """
+    groups = []
+    buffer = []
+    runs = []
+    inOrder = True
+    for item in items:
+        if inOrder:
+            if groups and item == groups[-1][0]:
+                groups[-1][1] += 1
+                continue
+            if not groups or groups[-1][0] < item:
+                groups.append([item, 1])
+                continue
+            inOrder = False
+        buffer.append(item)
+        if len(buffer) >= memoryBudget:
+            runs.append(_spillRun(_groupSorted(sorted(buffer)), directory))
+            buffer = []
+
+    groups = [(item, count) for item, count in groups]
+    if inOrder:
+        return groups
+    buffer.sort()
+    sources = [iter(groups), _groupSorted(buffer)]
+    sources.extend(_loadRun(path) for path in runs)
+    return list(_mergeGroups(heapq.merge(*sources)))
 
 
 class LinkedBST(AbstractCollection):
     """An link-based binary search tree implementation."""
 
-    def __init__(self, sourceCollection=None):
+    def __init__(self, sourceCollection=None, multiset=False):
         """Sets the initial state of self, which includes the
-        contents of sourceCollection, if it's present."""
+        contents of sourceCollection, if it's present.
+        If multiset is True, equal items share one node that
+        keeps their number of occurrences."""
         self._root = None
+        self._multiset = multiset
+        self._nodeCount = 0
+        self._journal = None
         AbstractCollection.__init__(self, sourceCollection)
 
+    def __add__(self, other):
+        """Returns a new tree, in the same mode as self, containing
+        the contents of self and other."""
+        result = type(self)(self, multiset=self._multiset)
+        for item in other:
+            result.add(item)
+        return result
+
+    @classmethod
+    def from_file(cls, path, normalize=str.lower, dedupe=True,
+                  encoding='utf-8', memory_budget=1 << 20, multiset=False):
+        """
+        Returns a balanced tree of the lines of the file at path.
+        ---------------------------------------------------------------------
+        Arguments:
+            path (str) - the path to file with one item per line.
+            normalize (callable) - applied to every line, or None.
+                It may return any picklable, comparable item.
+            dedupe (bool) - keep a single node per distinct item.
+                In multiset mode repeats become occurrence counts.
+            encoding (str) - the encoding of the file.
+            memory_budget (int) - the most unsorted lines held in memory
+                before a sorted run is spilled to a temporary file.
+            multiset (bool) - the mode of the new tree.
+        ---------------------------------------------------------------------
+        The file is streamed in chunks. Already sorted input, such as
+        words.txt, is grouped as it is read and never sorted; any other
+        input is sorted in runs and merged. Either way the tree is
+        linked from the sorted items in linear time.
+        """
+        lines = (line for line in _readLines(path, encoding) if line)
+        if normalize is not None:
+            lines = map(normalize, lines)
+
+        with tempfile.TemporaryDirectory() as directory:
+            groups = _sortedGroups(lines, memory_budget, directory)
+
+        return cls._fromGroups(groups, dedupe, multiset)
+
+    @classmethod
+    def _fromGroups(cls, groups, dedupe, multiset):
+        """Returns a balanced tree linked in linear time from sorted
+        (item, count) pairs."""
+        tree = cls(multiset=multiset)
+        nodes = []
+        for item, count in groups:
+            if multiset:
+                nodes.append(BSTCountNode(item, count=count))
+                tree._size += count
+            elif dedupe:
+                nodes.append(BSTNode(item))
+                tree._size += 1
+            else:
+                nodes.extend(BSTNode(item) for _ in range(count))
+                tree._size += count
+        tree._root = tree._linkBalanced(nodes)
+        tree._nodeCount = len(nodes)
+        return tree
+
     # Accessor methods
     def __str__(self):
         """Returns a string representation with the tree rotated
@@ -31,7 +218,10 @@ class LinkedBST(AbstractCollection):
             if node != None:
                 s += recurse(node.right, level + 1)
                 s += "| " * level
-                s += str(node.data) + "\n"
+                s += str(node.data)
+                if node.count > 1:
+                    s += " x" + str(node.count)
+                s += "\n"
                 s += recurse(node.left, level + 1)
             return s
 
@@ -40,40 +230,65 @@ class LinkedBST(AbstractCollection):
     def __iter__(self):
         """Supports a preorder traversal on a view of self."""
         if not self.isEmpty():
-            stack = LinkedStack()
+            stack = ArrayStack()
             stack.push(self._root)
             while not stack.isEmpty():
                 node = stack.pop()
-                yield node.data
+                for _ in range(node.count):
+                    yield node.data
                 if node.right != None:
                     stack.push(node.right)
                 if node.left != None:
                     stack.push(node.left)
 
     def preorder(self):
-        """Supports a preorder traversal on a view of self."""
-        return None
+        """Supports a preorder traversal on a view of self.
+        The view is a snapshot, so self may change during the loop."""
+        return iter(list(self))
 
     def inorder(self):
-        """Supports an inorder traversal on a view of self."""
+        """Supports an inorder traversal on a view of self.
+        The view is a snapshot, so self may change during the loop."""
         lyst = list()
-
-        def recurse(node):
-            if node != None:
-                recurse(node.left)
-                lyst.append(node.data)
-                recurse(node.right)
-
-        recurse(self._root)
+        for node in self._inorderNodes():
+            lyst.extend([node.data] * node.count)
         return iter(lyst)
 
     def postorder(self):
-        """Supports a postorder traversal on a view of self."""
-        return None
+        """Supports a postorder traversal on a view of self.
+        The view is a snapshot, so self may change during the loop."""
+        lyst = list()
+        stack = ArrayStack()
+        node = self._root
+        lastVisited = None
+        while node != None or not stack.isEmpty():
+            if node != None:
+                stack.push(node)
+                node = node.left
+            else:
+                top = stack.peek()
+                if top.right != None and top.right is not lastVisited:
+                    node = top.right
+                else:
+                    lyst.extend([top.data] * top.count)
+                    lastVisited = stack.pop()
+        return iter(lyst)
 
     def levelorder(self):
-        """Supports a levelorder traversal on a view of self."""
-        return None
+        """Supports a levelorder traversal on a view of self.
+        The view is a snapshot, so self may change during the loop."""
+        lyst = list()
+        if not self.isEmpty():
+            queue = ArrayQueue()
+            queue.add(self._root)
+            while not queue.isEmpty():
+                node = queue.pop()
+                lyst.extend([node.data] * node.count)
+                if node.left != None:
+                    queue.add(node.left)
+                if node.right != None:
+                    queue.add(node.right)
+        return iter(lyst)
 
     def __contains__(self, item):
         """Returns True if target is found or False otherwise."""
@@ -95,45 +310,77 @@ class LinkedBST(AbstractCollection):
 
         return recurse(self._root)
 
+    def find_many(self, items):
+        """Returns a list that holds, for each item in items, the
+        matched item in self or None. The items are sorted and looked
+        up in one descent that splits the batch at every node."""
+        items = list(items)
+        order = sorted(range(len(items)), key=items.__getitem__)
+        keys = [items[index] for index in order]
+        results = [None] * len(items)
+
+        def recurse(node, low, high):
+            # keys[low:high] are the items that may be under node
+            if node is None or low >= high:
+                return
+            start = bisect_left(keys, node.data, low, high)
+            stop = bisect_right(keys, node.data, start, high)
+            for index in range(start, stop):
+                results[order[index]] = node.data
+            recurse(node.left, low, start)
+            recurse(node.right, stop, high)
+
+        recurse(self._root, 0, len(keys))
+        return results
+
     # Mutator methods
     def clear(self):
         """Makes self become empty."""
+        record = self._encode("clear")
         self._root = None
         self._size = 0
+        self._nodeCount = 0
+        self._record(record)
 
     def add(self, item):
         """Adds item to the tree."""
+        record = self._encode("add", item)
 
         # Helper function to search for item's position
         def recurse(node):
+            # In a multiset an equal item only bumps the count
+            if self._multiset and item == node.data:
+                node.count += 1
             # New item is less, go left until spot is found
-            if item < node.data:
+            elif item < node.data:
                 if node.left == None:
-                    node.left = BSTNode(item)
+                    node.left = self._newNode(item)
                 else:
                     recurse(node.left)
+                _updateHeight(node)
             # New item is greater or equal,
             # go right until spot is found
-            elif node.right == None:
-                node.right = BSTNode(item)
             else:
-                recurse(node.right)
+                if node.right == None:
+                    node.right = self._newNode(item)
+                else:
+                    recurse(node.right)
+                _updateHeight(node)
                 # End of recurse
 
         # Tree is empty, so new item goes at the root
         if self.isEmpty():
-            self._root = BSTNode(item)
+            self._root = self._newNode(item)
         # Otherwise, search for the item's spot
         else:
             recurse(self._root)
         self._size += 1
+        self._record(record)
 
     def remove(self, item):
         """Precondition: item is in self.
         Raises: KeyError if item is not in self.
         postcondition: item is removed from self."""
-        if not item in self:
-            raise KeyError("Item not in tree.""")
 
         # Helper function to adjust placement of an item
         def liftMaxInLeftSubtreeToTop(top):
@@ -142,32 +389,43 @@ class LinkedBST(AbstractCollection):
             # Post: the maximum node in top's left subtree
             #       has been removed
             # Post: top.data = maximum value in top's left subtree
+            # Post: heights from top down to the max are recomputed
             parent = top
+            spine = [top]
             currentNode = top.left
             while not currentNode.right == None:
                 parent = currentNode
+                spine.append(parent)
                 currentNode = currentNode.right
             top.data = currentNode.data
+            if self._multiset:
+                top.count = currentNode.count
             if parent == top:
                 top.left = currentNode.left
             else:
                 parent.right = currentNode.left
+            for node in reversed(spine):
+                _updateHeight(node)
 
         # Begin main part of the method
-        if self.isEmpty(): return None
+        if self.isEmpty():
+            raise KeyError("Item not in tree.")
 
-        # Attempt to locate the node containing the item
+        # Locate the node containing the item in a single descent
+        record = self._encode("remove", item)
         itemRemoved = None
         preRoot = BSTNode(None)
         preRoot.left = self._root
         parent = preRoot
         direction = 'L'
+        path = []
         currentNode = self._root
         while not currentNode == None:
             if currentNode.data == item:
                 itemRemoved = currentNode.data
                 break
             parent = currentNode
+            path.append(parent)
             if currentNode.data > item:
                 direction = 'L'
                 currentNode = currentNode.left
@@ -175,8 +433,16 @@ class LinkedBST(AbstractCollection):
                 direction = 'R'
                 currentNode = currentNode.right
 
-        # Return None if the item is absent
-        if itemRemoved == None: return None
+        # Raise if the descent fell off the tree
+        if currentNode == None:
+            raise KeyError("Item not in tree.")
+
+        # In a multiset drop one occurrence while others remain
+        if currentNode.count > 1:
+            currentNode.count -= 1
+            self._size -= 1
+            self._record(record)
+            return itemRemoved
 
         # The item is present, so remove its node
 
@@ -203,25 +469,259 @@ class LinkedBST(AbstractCollection):
             else:
                 parent.right = newChild
 
-        # All cases: Reset the root (if it hasn't changed no harm done)
+        # All cases: Recompute the heights on the path to the node
+        #            Reset the root (if it hasn't changed no harm done)
         #            Decrement the collection's size counter
         #            Return the item
+        for node in reversed(path):
+            _updateHeight(node)
         self._size -= 1
+        self._nodeCount -= 1
         if self.isEmpty():
             self._root = None
         else:
             self._root = preRoot.left
+        self._record(record)
         return itemRemoved
 
+    def remove_many(self, items, rebalance=False):
+        """
+        Removes one occurrence of every item in items, skipping those
+        that are not in self, and returns the number of items removed.
+        The batch is sorted and removed in one traversal that only
+        enters subtrees whose key range overlaps the batch; keys whose
+        occurrences are all removed drop off the ends of the range.
+        If rebalance is True, rebalances self once at the end.
+        """
+        items = list(items)
+        record = self._encode("remove_many", items)
+        keys = []
+        pending = []
+        for item, count in _groupSorted(sorted(items)):
+            keys.append(item)
+            pending.append(count)
+        removed = 0
+        unlinked = 0
+
+        def recurse(node, low, high):
+            # keys[low:high] are the pending items that may be under node
+            nonlocal removed, unlinked
+            while low < high and pending[low] == 0:
+                low += 1
+            while low < high and pending[high - 1] == 0:
+                high -= 1
+            if node is None or low >= high:
+                return node
+            start = bisect_left(keys, node.data, low, high)
+            stop = bisect_right(keys, node.data, start, high)
+            # Equal items may sit on either side after a rebalance
+            node.left = recurse(node.left, low, stop)
+            deleted = False
+            if start < stop and pending[start] > 0:
+                taken = min(pending[start], node.count)
+                pending[start] -= taken
+                removed += taken
+                if taken < node.count:
+                    node.count -= taken
+                else:
+                    deleted = True
+            node.right = recurse(node.right, start, high)
+            if deleted:
+                unlinked += 1
+                return _join(node.left, node.right)
+            _updateHeight(node)
+            return node
+
+        self._root = recurse(self._root, 0, len(keys))
+        self._size -= removed
+        self._nodeCount -= unlinked
+        self._record(record)
+        if rebalance:
+            self.rebalance()
+        return removed
+
+    def remove_range(self, low, high, rebalance=False):
+        """
+        Removes every item where low <= item <= high and returns the
+        number of items removed. Subtrees that lie wholly in the range
+        are detached at once, so this takes O(h + k) for k removals.
+        If rebalance is True, rebalances self once at the end.
+        """
+        record = self._encode("remove_range", low, high)
+        removed = 0
+        unlinked = 0
+
+        def discard(node):
+            # Counts the items of the detached subtree at node
+            nonlocal removed, unlinked
+            stack = [node] if node is not None else []
+            while stack:
+                node = stack.pop()
+                removed += node.count
+                unlinked += 1
+                if node.left is not None:
+                    stack.append(node.left)
+                if node.right is not None:
+                    stack.append(node.right)
+
+        def keepBelow(node):
+            # Keeps the items below low in a subtree that lies at or
+            # below high; node and its right subtree go if node >= low
+            if node is None:
+                return None
+            if node.data < low:
+                node.right = keepBelow(node.right)
+                _updateHeight(node)
+                return node
+            node.left, left = None, node.left
+            discard(node)
+            return keepBelow(left)
+
+        def keepAbove(node):
+            # Mirror of keepBelow for a subtree at or above low
+            if node is None:
+                return None
+            if high < node.data:
+                node.left = keepAbove(node.left)
+                _updateHeight(node)
+                return node
+            node.right, right = None, node.right
+            discard(node)
+            return keepAbove(right)
+
+        def recurse(node):
+            if node is None:
+                return None
+            if node.data < low:
+                node.right = recurse(node.right)
+            elif high < node.data:
+                node.left = recurse(node.left)
+            else:
+                left = keepBelow(node.left)
+                right = keepAbove(node.right)
+                node.left = node.right = None
+                discard(node)
+                return _join(left, right)
+            _updateHeight(node)
+            return node
+
+        self._root = recurse(self._root)
+        self._size -= removed
+        self._nodeCount -= unlinked
+        self._record(record)
+        if rebalance:
+            self.rebalance()
+        return removed
+
+    def _encode(self, operation, *args):
+        """Returns the journal record of a mutation that is about to
+        run, or None if self has no journal. Raises before anything
+        changes if the arguments cannot be journaled."""
+        if self._journal is None:
+            return None
+        return self._journal.encode(operation, *args)
+
+    def _record(self, record):
+        """Writes the record of a mutation that has just succeeded to
+        the journal of self, if any. A call that raises is never
+        recorded."""
+        if record is not None:
+            self._journal.record(record)
+
+    def _newNode(self, item):
+        """Returns a fresh node for item that matches the mode of self."""
+        self._nodeCount += 1
+        if self._multiset:
+            return BSTCountNode(item)
+        return BSTNode(item)
+
+    def _footprint(self):
+        """Returns the number of nodes of self and the bytes they take.
+        All nodes of a tree share one type, so one size serves."""
+        if self._root is None:
+            return 0, 0
+        return self._nodeCount, self._nodeCount * sys.getsizeof(self._root)
+
+    def _keys(self):
+        """Supports iteration over the key of every node of self,
+        without repeating a key for its occurrence count."""
+        for node in self._nodes():
+            yield node.data
+
+    def _rangeNodes(self, low, high):
+        """Supports an inorder traversal over the nodes of self whose
+        items lie between low and high, skipping the other subtrees."""
+        stack = ArrayStack()
+        node = self._root
+        while node != None or not stack.isEmpty():
+            if node != None:
+                if node.data < low:
+                    node = node.right
+                else:
+                    stack.push(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if high < node.data:
+                    return
+                yield node
+                node = node.right
+
+    def _nodes(self):
+        """Supports a preorder traversal over the nodes of self."""
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def _inorderNodes(self):
+        """Supports an inorder traversal over the nodes of self."""
+        stack = ArrayStack()
+        node = self._root
+        while node != None or not stack.isEmpty():
+            if node != None:
+                stack.push(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def _linkBalanced(self, nodes):
+        """Links the sorted list of nodes into a balanced tree in
+        linear time and returns its root. Occurrence counts are kept."""
+
+        def recurse(low, high):
+            if low >= high:
+                return None
+
+            mid_index = (low + high) // 2
+
+            root = nodes[mid_index]
+
+            root.left = recurse(low, mid_index)
+            root.right = recurse(mid_index + 1, high)
+            _updateHeight(root)
+
+            return root
+
+        return recurse(0, len(nodes))
+
     def replace(self, item, newItem):
         """
         If item is in self, replaces it with newItem and
         returns the old item, or returns None otherwise."""
+        record = self._encode("replace", item, newItem)
         probe = self._root
         while probe != None:
             if probe.data == item:
                 oldData = probe.data
                 probe.data = newItem
+                self._record(record)
                 return oldData
             elif probe.data > item:
                 probe = probe.left
@@ -229,35 +729,81 @@ class LinkedBST(AbstractCollection):
                 probe = probe.right
         return None
 
+    def count(self, item):
+        """
+        Returns the number of occurrences of item in self.
+        :param item:
+        :return: int
+        """
+        total = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if item < node.data:
+                stack.append(node.left)
+            elif node.data < item:
+                stack.append(node.right)
+            else:
+                # Equal items may sit on either side after a rebalance
+                total += node.count
+                stack.append(node.left)
+                stack.append(node.right)
+        return total
+
+    def most_common(self, k=None):
+        """
+        Returns a list of the k most common items with their counts,
+        from the most common to the least. Lists every distinct item
+        if k is None.
+        :param k:
+        :return: list of (item, count) pairs
+        """
+        counts = []
+        for node in self._inorderNodes():
+            if counts and counts[-1][0] == node.data:
+                counts[-1][1] += node.count
+            else:
+                counts.append([node.data, node.count])
+        pairs = [(item, total) for item, total in counts]
+        if k is None:
+            return sorted(pairs, key=lambda pair: pair[1], reverse=True)
+        return heapq.nlargest(k, pairs, key=lambda pair: pair[1])
+
     def height(self):
         '''
-        Return the height of tree
+        Return the height of tree, -1 for an empty tree.
+        Every node stores the height of its subtree, so this is O(1).
         :return: int
         '''
-
-        def height1(top):
-            '''
-            Helper function
-            :param top:
-            :return:
-            '''
-            if top is None:
-                return -1
-
-            left_kid = top.left
-            right_kid = top.right
-            cur_height = max(height1(left_kid), height1(right_kid)) + 1
-
-            return cur_height
-
-        return height1(self._root)
+        return _height(self._root)
 
     def is_balanced(self):
         '''
-        Return True if tree is balanced
+        Return True if tree is balanced, that is, its height is the
+        smallest possible for its number of nodes.
         :return:
         '''
-        return self.height() < log(self._size - 1) + 1
+        # The smallest height for n nodes is floor(log2(n)), -1 if empty
+        return self.height() <= self._nodeCount.bit_length() - 1
+
+    def balance_report(self, k=5):
+        '''
+        Returns up to k of the most skewed subtrees, those whose
+        children differ in height by more than one, as a list of
+        (item at the subtree root, right height - left height,
+        subtree height) triples, the most skewed first.
+        :param k:
+        :return: list
+        '''
+        skewed = []
+        for node in self._nodes():
+            balance = _height(node.right) - _height(node.left)
+            if abs(balance) > 1:
+                skewed.append((node.data, balance, node.height))
+        return heapq.nlargest(k, skewed,
+                              key=lambda entry: (abs(entry[1]), entry[2]))
 
     def range_find(self, low, high):
         '''
@@ -266,12 +812,10 @@ class LinkedBST(AbstractCollection):
         :param high:
         :return:
         '''
-        tree_list = list(self.inorder())
         result_arr = []
 
-        for elem in tree_list:
-            if elem >= low and elem <= high:
-                result_arr.append(elem)
+        for node in self._rangeNodes(low, high):
+            result_arr.extend([node.data] * node.count)
 
         return result_arr
 
@@ -280,27 +824,7 @@ class LinkedBST(AbstractCollection):
         Rebalances the tree.
         :return:
         '''
-        def recurse(tree_lst):
-            """
-            Helper recursive function to rebalance tree.
-            """
-            if len(tree_lst) == 1:
-                return BSTNode(tree_lst[0])
-            if len(tree_lst) < 1:
-                return None
-
-            mid_index = len(tree_lst) // 2
-
-            root = BSTNode(tree_lst[mid_index])
-
-            root.left = recurse(tree_lst[:mid_index])
-            root.right = recurse(tree_lst[mid_index + 1:])
-
-            return root
-
-        tree_lst = list(self.inorder())
-        balanced_root = recurse(tree_lst)
-        self._root = balanced_root
+        self._root = self._linkBalanced(list(self._inorderNodes()))
 
     def successor(self, item):
         """
@@ -385,13 +909,7 @@ class LinkedBST(AbstractCollection):
             4) time of searching 10.000 random words in vocabulary
                as a binary search tree after its rebalancing.
         """
-        that_string = ''
-
-        with open(path, 'r') as file:
-            for line in file:
-                that_string += line.lower()
-
-        all_words_list = that_string.split('\n')
+        all_words_list = [line.lower() for line in _readLines(path, 'utf-8')]
 
         random_list = []
         that_list_copy = all_words_list.copy()
@@ -5,6 +5,7 @@ Author: Ken Lambert
 
 from node import Node
 from abstractstack import AbstractStack
+import sys
 
 class LinkedStack(AbstractStack):
     """A link-based stack implementation."""
@@ -18,17 +19,25 @@ class LinkedStack(AbstractStack):
 
     # Accessor methods
     def __iter__(self):
-        """Supports iteration over a view of self."""
-        
-        def visitNodes(node):
-            """Adds items to tempList from tail to head."""
-            if not node is None:
-                visitNodes(node.next)
-                tempList.append(node.data)
-                
-        tempList = list()                
-        visitNodes(self._items)
-        return iter(tempList)
+        """Supports iteration over a view of self, from bottom to top."""
+        # The links run from top to bottom, so walk them once
+        # and hand the items back in reverse
+        nodes = list(self._nodes())
+        while nodes:
+            yield nodes.pop().data
+
+    def _footprint(self):
+        """Returns the number of nodes of self and the bytes they take."""
+        if self._items is None:
+            return 0, 0
+        return self._size, self._size * sys.getsizeof(self._items)
+
+    def _nodes(self):
+        """Supports iteration over the nodes of self from top to bottom."""
+        node = self._items
+        while node is not None:
+            yield node
+            node = node.next
 
     def peek(self):
         """